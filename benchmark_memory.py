@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+内存对比测试脚本
+比较常驻进程保存查询结果的两种方式每条占用多少字节：
+- 直接保存：dict 里存 fetch_translation 的格式化字符串 + 解析出的 DictEntry 对象
+- CompactDictStore：驻留表 + 连续 UTF-8 缓冲区 + 偏移量数组
+
+使用随机生成的、与真实查询结果大小相近的条目，不需要联网。
+
+直接保存方式是逐条统计的（每条统计完就释放，再加上 dict 哈希表本身的大小），
+所以测 1M 条也不需要把几 GB 的 dict 真正放进内存。
+
+运行示例：
+    python benchmark_memory.py                             # 10k、100k 条
+    python benchmark_memory.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import fields
+
+from dict_store import (
+    BasicSense,
+    CollinsSense,
+    CompactDictStore,
+    DictEntry,
+    format_entry,
+)
+
+
+BASIC_POS = ["n.", "v.", "adj.", "int."]
+COLLINS_POS = ["N-COUNT", "N-UNCOUNT", "VERB", "V-T", "ADJ", "ADJ-GRADED", "CONVENTION"]
+LABELS = ["[套语]", "[正式]", "[非正式]", "[英国英语]", "[美国英语]"]
+# 常用汉字，用来拼出长度接近真实释义的中文
+HANZI = "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可也你说"
+
+
+def _english(rng, words: int) -> str:
+    return " ".join(
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(2, 9)))
+        for _ in range(words)
+    ).capitalize() + "."
+
+
+def _chinese(rng, chars: int) -> str:
+    return "".join(rng.choices(HANZI, k=chars))
+
+
+def make_entry(rng, index: int) -> DictEntry:
+    """生成一条随机条目：3 行基本翻译，3 条柯林斯释义，每条 1～2 个例句。"""
+    entry = DictEntry(f"word{index}")
+    for pos in rng.sample(BASIC_POS, 3):
+        entry.basic.append(BasicSense(pos, _chinese(rng, rng.randint(8, 30))))
+    for number in range(1, 4):
+        sense = CollinsSense(number, rng.choice(COLLINS_POS), _english(rng, 12))
+        sense.notes.append(_chinese(rng, 10))
+        if rng.random() < 0.3:
+            sense.notes.append(rng.choice(LABELS))
+        for _ in range(rng.randint(1, 2)):
+            sense.examples.append((_english(rng, 10), _chinese(rng, 16)))
+        entry.collins.append(sense)
+    return entry
+
+
+def deep_sizeof(obj, skip=()) -> int:
+    """
+    递归统计对象及其引用的所有对象占用的字节数（同一个对象只算一次）。
+
+    比 tracemalloc 快得多（tracemalloc 会拖慢每一次内存分配），
+    但不包含内存分配器自身的开销，结果略偏小。
+
+    参数:
+        obj: 要统计的对象
+        skip: 不计入的共享对象（如各条目共用的词性字符串）
+
+    C/Rust类比：
+    - C: 手动累加 sizeof(struct) + 每个 malloc 的长度
+    - Rust: 类似 deepsize / get-size crate
+    """
+    seen = {id(o) for o in skip}
+    stack = [obj]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return total
+
+
+def measure_naive(size: int) -> tuple:
+    """
+    统计直接保存方式（{单词: (格式化文本, DictEntry)}）占用的字节数，返回 (字节数, 耗时)。
+
+    逐条生成、统计、释放；dict 本身只保存单词（值为 None），用来计算哈希表的大小。
+    各条目共用的词性/标签字符串、属性名和小整数只算一次，与整体构建后统计的结果一致。
+    """
+    rng = random.Random(size)
+    attr_names = {
+        sys.intern(f.name) for cls in (DictEntry, BasicSense, CollinsSense) for f in fields(cls)
+    }
+    shared = BASIC_POS + COLLINS_POS + LABELS + sorted(attr_names) + [1, 2, 3, ""]
+    total = sum(sys.getsizeof(o) for o in shared)
+    index = {}
+    start = time.perf_counter()
+    for i in range(size):
+        entry = make_entry(rng, i)
+        # 值里的 DictEntry 引用了同一个单词字符串，键不用另算
+        total += deep_sizeof((format_entry(entry), entry), skip=shared)
+        index[entry.word] = None
+    elapsed = time.perf_counter() - start
+    # 值是元组时，哈希表本身的大小与这里相同
+    total += sys.getsizeof(index)
+    return total, elapsed
+
+
+def measure_compact(size: int) -> tuple:
+    """构建 CompactDictStore，返回 (存储, 字节数, 耗时)。"""
+    rng = random.Random(size)
+    store = CompactDictStore()
+    start = time.perf_counter()
+    for i in range(size):
+        store.add(make_entry(rng, i))
+    elapsed = time.perf_counter() - start
+    return store, deep_sizeof(store), elapsed
+
+
+def benchmark_access(store: CompactDictStore, size: int, lookups: int = 10000) -> float:
+    """随机读取并解码条目，返回平均每次耗时（微秒）。"""
+    rng = random.Random(0)
+    words = [f"word{rng.randrange(size)}" for _ in range(lookups)]
+    start = time.perf_counter()
+    for word in words:
+        store[word]
+    return (time.perf_counter() - start) / lookups * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="常驻词典存储内存对比测试")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10000, 100000],
+        help="条目数（默认 10000 100000；加上 1000000 条需要约 12 分钟和 1～2GB 内存）",
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("常驻词典存储 - 内存对比测试")
+    print("=" * 60)
+
+    rows = []
+    for size in args.sizes:
+        print(f"\n测试 {size:,} 条...")
+        naive_bytes, naive_time = measure_naive(size)
+        store, compact_bytes, compact_time = measure_compact(size)
+        access_us = benchmark_access(store, size)
+        del store
+        rows.append((size, naive_bytes / size, compact_bytes / size, access_us))
+        print(f"  直接保存: 构建 {naive_time:.1f} 秒，{naive_bytes / 2**20:,.1f} MB")
+        print(f"  紧凑存储: 构建 {compact_time:.1f} 秒，{compact_bytes / 2**20:,.1f} MB")
+
+    print("\n" + "=" * 60)
+    print("📊 每条占用字节数")
+    print("=" * 60)
+    print(f"\n{'条目数':<12} {'直接保存':>12} {'紧凑存储':>12} {'节省':>8} {'读取解码':>12}")
+    print("-" * 60)
+    for size, naive_per, compact_per, access_us in rows:
+        print(
+            f"{size:<12,} {naive_per:>10,.0f} B {compact_per:>10,.0f} B "
+            f"{naive_per / compact_per:>6.1f}x {access_us:>9.1f} µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+紧凑的常驻词典存储
+在同一个进程里保存几十万条查询结果，每条约 1KB（直接保存的五分之一左右）。
+
+fetch_translation() 返回的是一整段格式化好的字符串，
+常驻进程如果直接把它（以及解析出来的每条释义对象）放进 dict，
+每个单词要占几 KB 内存。CompactDictStore 的做法：
+
+- 词性标注（n., N-COUNT ...）和标签（[套语] ...）只保存一份，记录里存编号
+- 所有条目编码成 UTF-8 连续写进同一个 bytearray，用 array 记录每条的偏移量
+- 单词索引是 array 实现的开放寻址哈希表，不为每个单词保留 str 对象；
+  记录以单词开头，另用一个 array 记录单词的字节长度，比较单词时只切出这几个字节
+- 读取时才把字节解码成 DictEntry 对象（惰性解码）
+
+C/Rust类比：
+- C: 一块 malloc 出来的大缓冲区 + uint32_t offsets[] + 字符串驻留表
+- Rust: Vec<u8> + Vec<u32> + HashMap<&str, u32>（类似 string interner）
+- Python: bytearray + array.array + 列表/字典
+"""
+
+import re
+from array import array
+from dataclasses import dataclass, field
+
+
+COLLINS_HEADER = "【柯林斯英汉双解大词典】"
+BASIC_HEADER = "【基本翻译】"
+
+# 记录内部使用的分隔符（ASCII 控制字符，正常的释义文本里不会出现）
+_RECORD_SEP = "\x1e"  # 分隔 单词 / 基本翻译 / 柯林斯翻译
+_SENSE_SEP = "\x1d"  # 分隔释义
+_FIELD_SEP = "\x1f"  # 分隔释义内的字段
+_ITEM_SEP = "\x1c"  # 分隔字段内的列表项
+_TAG_MARK = "\x1a"  # 标记驻留的标签
+_SEPARATORS = (_RECORD_SEP, _SENSE_SEP, _FIELD_SEP, _ITEM_SEP, _TAG_MARK)
+
+# 基本翻译里视为词性开头的前缀（与 fetch_translation 的格式化规则一致）
+_BASIC_POS_PREFIXES = ("int.", "n.", "v.", "adj.")
+
+# 柯林斯释义的序号行，如 "1. N-COUNT ..."
+_SENSE_NUMBER = re.compile(r"(\d+)\.(?:\s+|$)")
+
+
+@dataclass
+class BasicSense:
+    """基本翻译中的一行：词性 + 释义，如 ("n.", "招呼，问候")。"""
+
+    pos: str
+    text: str
+
+
+@dataclass
+class CollinsSense:
+    """
+    柯林斯词典中的一条释义。
+
+    字段:
+        number (int): 释义序号
+        pos (str): 词性标注（如 N-COUNT、CONVENTION），可能为空
+        definition (str): 英英释义
+        notes (list[str]): 释义下方的附加行（中文翻译、[套语] 等标签）
+        examples (list[tuple[str, str]]): 例句（英文, 中文），中文可能为空
+    """
+
+    number: int
+    pos: str
+    definition: str
+    notes: list = field(default_factory=list)
+    examples: list = field(default_factory=list)
+
+
+@dataclass
+class DictEntry:
+    """一个单词的完整查询结果。"""
+
+    word: str
+    basic: list = field(default_factory=list)
+    collins: list = field(default_factory=list)
+
+
+def _is_collins_pos(token: str) -> bool:
+    # 柯林斯的词性标注是全大写的，如 N-COUNT、VERB、ADJ-GRADED
+    return len(token) >= 2 and token.replace("-", "").isalpha() and token.isupper()
+
+
+def _is_label(text: str) -> bool:
+    return text.startswith("[") and text.endswith("]")
+
+
+def parse_translation_text(word: str, text: str) -> DictEntry:
+    """
+    把 fetch_translation() 返回的格式化文本解析成 DictEntry。
+
+    参数:
+        word (str): 查询的单词
+        text (str): fetch_translation() 的返回值
+
+    返回:
+        DictEntry: 结构化的查询结果
+
+    异常:
+        ValueError: text 是错误信息而不是翻译结果
+    """
+    if BASIC_HEADER not in text:
+        raise ValueError(f"不是有效的翻译结果: {text[:50]}")
+
+    entry = DictEntry(word)
+    section = None
+    sense = None
+    for line in text.split("\n"):
+        if line == COLLINS_HEADER:
+            section = "collins"
+        elif line == BASIC_HEADER:
+            section = "basic"
+        elif not line.strip():
+            continue
+        elif section == "basic":
+            stripped = line.strip()
+            if stripped.startswith(_BASIC_POS_PREFIXES):
+                # "  n. 招呼，问候"
+                pos, _, rest = stripped.partition(" ")
+                entry.basic.append(BasicSense(pos, rest))
+            else:
+                entry.basic.append(BasicSense("", stripped))
+        elif section == "collins":
+            stripped = line.strip()
+            match = _SENSE_NUMBER.match(stripped)
+            if match:
+                # 序号行："  1. POS 英英释义"
+                rest = stripped[match.end() :]
+                head, _, definition = rest.partition(" ")
+                if _is_collins_pos(head):
+                    sense = CollinsSense(int(match.group(1)), head, definition)
+                else:
+                    sense = CollinsSense(int(match.group(1)), "", rest)
+                entry.collins.append(sense)
+            elif sense is None:
+                continue
+            elif stripped.startswith("例："):
+                sense.examples.append((stripped[len("例："):], ""))
+            elif sense.examples and not sense.examples[-1][1]:
+                # 例句下一行是例句的中文翻译
+                sense.examples[-1] = (sense.examples[-1][0], stripped)
+            else:
+                sense.notes.append(stripped)
+    return entry
+
+
+def format_entry(entry: DictEntry) -> str:
+    """
+    把 DictEntry 格式化成与 fetch_translation() 相同的文本。
+    """
+    result = []
+    if entry.collins:
+        result.append(COLLINS_HEADER)
+        for i, sense in enumerate(entry.collins):
+            if i:
+                result.append("")
+            head = f"{sense.number}. "
+            if sense.pos:
+                head += f"{sense.pos} "
+            result.append(f"  {head}{sense.definition}".rstrip())
+            result.extend(f"    {note}" for note in sense.notes)
+            for english, chinese in sense.examples:
+                result.append(f"    例：{english}")
+                if chinese:
+                    result.append(f"    {chinese}")
+        result.append("")
+
+    result.append(BASIC_HEADER)
+    for sense in entry.basic:
+        if sense.pos:
+            result.append(f"  {sense.pos} {sense.text}".rstrip())
+        else:
+            result.append(f"    {sense.text}")
+    return "\n".join(result)
+
+
+def _clean(text: str) -> str:
+    """去掉文本里的分隔符，保证编码后的记录可以无歧义地拆开。"""
+    for sep in _SEPARATORS:
+        if sep in text:
+            text = text.replace(sep, " ")
+    return text
+
+
+class CompactDictStore:
+    """
+    紧凑的常驻词典存储。
+
+    用法:
+        store = CompactDictStore()
+        store.add_translation("hello", fetch_translation("hello"))
+        entry = store["hello"]            # DictEntry，按需解码
+        text = store.get_text("hello")    # 与 fetch_translation 相同的格式
+
+    同一个单词重复添加时，新记录追加到缓冲区末尾并替换索引，
+    旧记录占用的字节不会回收（常驻进程里查询结果基本不变，这样换来了简单的实现）。
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        # 第 i 条记录是 _buffer[_offsets[i]:_offsets[i + 1]]，
+        # 记录开头的 _word_lens[i] 个字节是单词本身
+        self._offsets = array("Q", [0])
+        self._word_lens = array("I")
+        # 驻留表：词性标注和标签 -> 编号
+        self._tags = []
+        self._tag_ids = {}
+        # 开放寻址哈希表：槽位里存记录编号，-1 表示空槽
+        self._slots = array("i", [-1]) * 8
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) >= 0
+
+    def __getitem__(self, word: str) -> DictEntry:
+        index = self._find(word)
+        if index < 0:
+            raise KeyError(word)
+        return self._decode(index)
+
+    def __iter__(self):
+        for index in self._slots:
+            if index >= 0:
+                yield self._word_bytes(index).decode("utf-8")
+
+    def get(self, word: str, default=None):
+        index = self._find(word)
+        return self._decode(index) if index >= 0 else default
+
+    def get_text(self, word: str, default=None):
+        """返回与 fetch_translation() 相同格式的文本。"""
+        entry = self.get(word)
+        return format_entry(entry) if entry is not None else default
+
+    def add_translation(self, word: str, text: str) -> None:
+        """解析 fetch_translation() 的结果并保存。"""
+        self.add(parse_translation_text(word, text))
+
+    def add(self, entry: DictEntry) -> None:
+        """保存一条查询结果。"""
+        word = _clean(entry.word).encode("utf-8")
+        record = self._encode(entry)
+        self._buffer += record
+        index = len(self._offsets) - 1
+        self._offsets.append(len(self._buffer))
+        self._word_lens.append(len(word))
+
+        slot = self._probe(word)
+        if self._slots[slot] < 0:
+            self._count += 1
+        self._slots[slot] = index
+        if self._count * 3 > len(self._slots) * 2:
+            self._resize()
+
+    def nbytes(self) -> int:
+        """存储本身占用的字节数（缓冲区 + 偏移量/单词长度数组 + 哈希表，不含驻留表）。"""
+        return (
+            len(self._buffer)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._word_lens.itemsize * len(self._word_lens)
+            + self._slots.itemsize * len(self._slots)
+        )
+
+    # ---- 驻留表 ----
+
+    def _intern(self, tag: str) -> str:
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = self._tag_ids[tag] = len(self._tags)
+            self._tags.append(tag)
+        return str(tag_id)
+
+    # ---- 编码 / 解码 ----
+
+    def _encode(self, entry: DictEntry) -> bytes:
+        basic = _SENSE_SEP.join(
+            self._intern(s.pos) + _FIELD_SEP + _clean(s.text) for s in entry.basic
+        )
+        collins = _SENSE_SEP.join(
+            _FIELD_SEP.join(
+                (
+                    str(s.number),
+                    self._intern(s.pos),
+                    _clean(s.definition),
+                    # 标签（[套语]）驻留，其他附加行原样保存
+                    _ITEM_SEP.join(
+                        _TAG_MARK + self._intern(n) if _is_label(n) else _clean(n)
+                        for n in s.notes
+                    ),
+                    _ITEM_SEP.join(
+                        _clean(en) + _ITEM_SEP + _clean(zh) for en, zh in s.examples
+                    ),
+                )
+            )
+            for s in entry.collins
+        )
+        return (
+            _clean(entry.word) + _RECORD_SEP + basic + _RECORD_SEP + collins
+        ).encode("utf-8")
+
+    def _record(self, index: int) -> bytes:
+        return self._buffer[self._offsets[index] : self._offsets[index + 1]]
+
+    def _word_bytes(self, index: int) -> bytearray:
+        # 只切出单词本身的几个字节，不复制整条记录
+        start = self._offsets[index]
+        return self._buffer[start : start + self._word_lens[index]]
+
+    def _decode(self, index: int) -> DictEntry:
+        word, basic, collins = self._record(index).decode("utf-8").split(_RECORD_SEP)
+        tags = self._tags
+        entry = DictEntry(word)
+        if basic:
+            for sense in basic.split(_SENSE_SEP):
+                tag_id, text = sense.split(_FIELD_SEP)
+                entry.basic.append(BasicSense(tags[int(tag_id)], text))
+        if collins:
+            for sense in collins.split(_SENSE_SEP):
+                number, tag_id, definition, notes, examples = sense.split(_FIELD_SEP)
+                items = examples.split(_ITEM_SEP) if examples else []
+                entry.collins.append(
+                    CollinsSense(
+                        int(number),
+                        tags[int(tag_id)],
+                        definition,
+                        [
+                            tags[int(n[1:])] if n.startswith(_TAG_MARK) else n
+                            for n in notes.split(_ITEM_SEP)
+                        ]
+                        if notes
+                        else [],
+                        list(zip(items[::2], items[1::2])),
+                    )
+                )
+        return entry
+
+    # ---- 哈希索引 ----
+
+    def _probe(self, word: bytes) -> int:
+        """线性探测：返回 word（UTF-8 编码）所在的槽位，或者应当插入的空槽位。"""
+        mask = len(self._slots) - 1
+        size = len(word)
+        slot = hash(word) & mask
+        while True:
+            index = self._slots[slot]
+            if index < 0 or (
+                self._word_lens[index] == size and self._word_bytes(index) == word
+            ):
+                return slot
+            slot = (slot + 1) & mask
+
+    def _find(self, word: str) -> int:
+        return self._slots[self._probe(_clean(word).encode("utf-8"))]
+
+    def _resize(self) -> None:
+        old = self._slots
+        self._slots = array("i", [-1]) * (len(old) * 2)
+        mask = len(self._slots) - 1
+        for index in old:
+            if index < 0:
+                continue
+            slot = hash(bytes(self._word_bytes(index))) & mask
+            while self._slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            self._slots[slot] = index
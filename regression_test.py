@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+回归测试脚本 - 用录制的页面离线验证解析结果和解析速度
+
+test_youdao.py 每个单词启动一个新的 Python 进程、串行访问线上网站，只检查退出码。
+这个脚本直接导入解析函数，在本进程（或进程池）里并行解析 fixtures/pages/ 下录制的页面，
+把结构化结果和 fixtures/golden/ 下的标准答案逐项比较，并报告每个用例的解析耗时。
+
+fixtures/baseline/ 下保存的是旧版本 youdao_dict.py（解析逻辑拆分成 parse_* 之前）
+重放同一批页面得到的输出，用来确认拆分前后 fetch_* 的结果逐字一致。
+标准答案可以用 --update 重写，对照结果只能用 --baseline-from 从旧代码重新生成。
+
+目录结构：
+    fixtures/pages/<单词>.html       录制的查询结果页面
+    fixtures/golden/<单词>.json      对应的标准答案
+    fixtures/baseline/<单词>.json    旧版本 fetch_* 函数的输出
+
+运行示例：
+    python regression_test.py                      # 运行全部用例
+    python regression_test.py -k hello             # 只运行名字包含 hello 的用例
+    python regression_test.py --update             # 用当前解析结果重写标准答案
+    python regression_test.py --record run walk    # 联网录制新页面并生成标准答案
+
+    # 用拆分前的代码重放页面，生成对照结果
+    git show 7bab553:youdao_dict.py > /tmp/youdao_dict_old.py
+    python regression_test.py --baseline-from /tmp/youdao_dict_old.py
+"""
+
+import argparse
+import difflib
+import importlib.util
+import json
+import os
+import sys
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import requests
+
+from dict_store import parse_translation_text
+from youdao_dict import (
+    build_search_url,
+    format_translation,
+    is_error,
+    lookup_key,
+    parse_basic_translation,
+    parse_collins_translation,
+    parse_translation_css,
+)
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+PAGES_DIR = FIXTURES_DIR / "pages"
+GOLDEN_DIR = FIXTURES_DIR / "golden"
+BASELINE_DIR = FIXTURES_DIR / "baseline"
+
+# 参与比较的解析函数：名字 -> 函数
+EXTRACTORS = {
+    "basic": parse_basic_translation,
+    "collins": parse_collins_translation,
+    "css": parse_translation_css,
+}
+
+
+def warm_up(page: Path) -> None:
+    """
+    先把每个解析函数跑一遍再计时。
+
+    第一次解析要初始化 bs4/lxml 的内部状态，会比之后慢一个数量级，
+    不预热的话第一个用例总会排在"最慢"列表的最前面。
+    """
+    html = page.read_text(encoding="utf-8")
+    for extractor in EXTRACTORS.values():
+        extractor(html)
+
+
+def run_case(page: Path) -> dict:
+    """
+    解析一个录制的页面，返回结构化结果和每个解析函数的耗时。
+
+    返回:
+        dict: {"name": 用例名, "output": 结构化结果, "timings": {解析函数: 秒}}
+    """
+    html = page.read_text(encoding="utf-8")
+    word = unquote(page.stem)
+
+    output = {"word": word}
+    timings = {}
+    for name, extractor in EXTRACTORS.items():
+        start = time.perf_counter()
+        text = extractor(html)
+        timings[name] = time.perf_counter() - start
+        output[name] = text.split("\n") if text else []
+
+    # 完整的结构化条目（与 CompactDictStore 保存的内容一致）
+    basic = "\n".join(output["basic"])
+    if is_error(basic):
+        output["entry"] = None
+    else:
+        text = format_translation(basic, "\n".join(output["collins"]))
+        output["entry"] = asdict(parse_translation_text(word, text))
+
+    return {"name": page.stem, "output": output, "timings": timings}
+
+
+def _dump(output: dict) -> str:
+    return json.dumps(output, ensure_ascii=False, indent=2) + "\n"
+
+
+def fetch_equivalents(output: dict) -> dict:
+    """
+    用当前的 parse_* / format_translation 算出旧版本各个 fetch_* 函数应当返回的文本。
+    """
+    basic = "\n".join(output["basic"])
+    collins = "\n".join(output["collins"])
+    return {
+        "fetch_basic_translation": basic,
+        "fetch_collins_translation": collins,
+        "fetch_translation": basic
+        if is_error(basic)
+        else format_translation(basic, collins),
+        "fetch_translation_xpath": "\n".join(output["css"]),
+    }
+
+
+def check_baseline(result: dict) -> str:
+    """
+    与旧版本 fetch_* 的输出比较；没有对照结果的用例（新录制的页面）跳过。
+    """
+    baseline = BASELINE_DIR / f"{result['name']}.json"
+    if not baseline.exists():
+        return ""
+    expected = json.loads(baseline.read_text(encoding="utf-8"))
+    actual = fetch_equivalents(result["output"])
+    diffs = []
+    for name, text in expected.items():
+        if actual.get(name) != text:
+            diffs.extend(
+                difflib.unified_diff(
+                    text.splitlines(keepends=True),
+                    actual.get(name, "").splitlines(keepends=True),
+                    fromfile=f"baseline/{baseline.name}:{name}",
+                    tofile="actual",
+                )
+            )
+            diffs.append("\n")
+    return "".join(diffs)
+
+
+def record_baseline(module_path: str, pages) -> None:
+    """
+    导入旧版本的 youdao_dict.py，让它的 fetch_* 函数"联网"时拿到录制的页面，
+    把输出保存到 fixtures/baseline/。
+    """
+    spec = importlib.util.spec_from_file_location("youdao_dict_baseline", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    for page in pages:
+        html = page.read_text(encoding="utf-8")
+        # 只替换旧模块里的 requests 名字，不影响全局的 requests 模块
+        module.requests = types.SimpleNamespace(
+            get=lambda *args, **kwargs: types.SimpleNamespace(status_code=200, text=html),
+            exceptions=requests.exceptions,
+        )
+        word = unquote(page.stem)
+        baseline = {
+            name: getattr(module, name)(word)
+            for name in (
+                "fetch_basic_translation",
+                "fetch_collins_translation",
+                "fetch_translation",
+                "fetch_translation_xpath",
+            )
+        }
+        (BASELINE_DIR / f"{page.stem}.json").write_text(_dump(baseline), encoding="utf-8")
+        print(f"已生成对照结果: {page.stem}")
+
+
+def check_case(result: dict, update: bool = False) -> str:
+    """
+    把解析结果和标准答案比较。
+
+    返回:
+        str: 空字符串表示通过；否则是差异（unified diff）或错误说明
+    """
+    golden = GOLDEN_DIR / f"{result['name']}.json"
+    actual = _dump(result["output"])
+    if update:
+        golden.write_text(actual, encoding="utf-8")
+        return ""
+    if not golden.exists():
+        return f"缺少标准答案 {golden}（用 --update 生成）"
+
+    expected = golden.read_text(encoding="utf-8")
+    if actual == expected:
+        return ""
+    return "".join(
+        difflib.unified_diff(
+            expected.splitlines(keepends=True),
+            actual.splitlines(keepends=True),
+            fromfile=f"golden/{golden.name}",
+            tofile="actual",
+        )
+    )
+
+
+def record_pages(words) -> list:
+    """联网下载查询结果页面，保存到 fixtures/pages/，返回保存的文件。"""
+    headers = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    }
+    PAGES_DIR.mkdir(parents=True, exist_ok=True)
+    pages = []
+    for word in words:
+        key = lookup_key(word)
+        response = requests.get(build_search_url(key), headers=headers, timeout=10)
+        response.raise_for_status()
+        page = PAGES_DIR / f"{quote(key, safe='')}.html"
+        page.write_text(response.text, encoding="utf-8")
+        print(f"已录制: {key} -> {page.name}")
+        pages.append(page)
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="有道词典解析回归测试（离线）")
+    parser.add_argument("-k", dest="pattern", help="只运行名字包含该字符串的用例")
+    parser.add_argument(
+        "--update", action="store_true", help="用当前解析结果重写标准答案"
+    )
+    parser.add_argument(
+        "--record", nargs="+", metavar="WORD", help="联网录制这些单词的页面并生成标准答案"
+    )
+    parser.add_argument(
+        "--baseline-from",
+        metavar="FILE",
+        help="用旧版本的 youdao_dict.py 重放页面，重新生成 fixtures/baseline/ 下的对照结果",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="并行解析的进程数（1 表示在当前进程里串行运行）",
+    )
+    parser.add_argument("--slowest", type=int, default=10, help="列出最慢的 N 个用例")
+    args = parser.parse_args()
+
+    if args.record:
+        pages = record_pages(args.record)
+        args.update = True
+    else:
+        pages = sorted(PAGES_DIR.glob("*.html"))
+        if args.pattern:
+            pages = [p for p in pages if args.pattern in p.stem]
+    if not pages:
+        print("没有找到测试用例")
+        sys.exit(1)
+    GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+    if args.baseline_from:
+        record_baseline(args.baseline_from, pages)
+
+    print("=" * 60)
+    print(f"有道词典解析回归测试：{len(pages)} 个用例")
+    print("=" * 60)
+
+    # 解析是 CPU 密集型，用进程池绕开 GIL；每个进程只导入一次解析函数，并先预热
+    workers = min(args.workers, len(pages))
+    start = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=warm_up, initargs=(pages[0],)
+        ) as executor:
+            results = list(executor.map(run_case, pages, chunksize=8))
+    else:
+        workers = 1
+        warm_up(pages[0])
+        results = [run_case(page) for page in pages]
+    wall_time = time.perf_counter() - start
+
+    failed = 0
+    for result in results:
+        diff = check_case(result, update=args.update) + check_baseline(result)
+        ms = "  ".join(
+            f"{name} {seconds * 1000:6.2f}ms"
+            for name, seconds in result["timings"].items()
+        )
+        if diff:
+            failed += 1
+            print(f"✗ {result['name']:<24} {ms}")
+            print(diff)
+        else:
+            print(f"✓ {result['name']:<24} {ms}")
+
+    print("\n" + "=" * 60)
+    print("📊 解析耗时")
+    print("=" * 60)
+    print(f"\n{'解析函数':<12} {'总计':>10} {'平均':>10} {'最慢':>10}")
+    print("-" * 60)
+    for name in EXTRACTORS:
+        times = [r["timings"][name] for r in results]
+        print(
+            f"{name:<12} {sum(times) * 1000:>8.1f}ms {sum(times) / len(times) * 1000:>8.2f}ms "
+            f"{max(times) * 1000:>8.2f}ms"
+        )
+
+    slowest = sorted(results, key=lambda r: sum(r["timings"].values()), reverse=True)
+    if args.slowest and len(results) > 1:
+        print(f"\n最慢的 {min(args.slowest, len(results))} 个用例:")
+        for result in slowest[: args.slowest]:
+            print(f"  {result['name']:<24} {sum(result['timings'].values()) * 1000:8.2f}ms")
+
+    print("\n" + "=" * 60)
+    if args.update:
+        print(f"已更新 {len(results)} 个标准答案，耗时 {wall_time:.2f} 秒")
+    else:
+        print(
+            f"测试结果: {len(results) - failed} 通过, {failed} 失败，"
+            f"耗时 {wall_time:.2f} 秒（{workers} 个进程）"
+        )
+    print("=" * 60)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
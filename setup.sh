@@ -44,6 +44,10 @@ echo ""
 echo "验证安装..."
 python3 -c "import requests, bs4, lxml; print('✓ requests, beautifulsoup4, lxml 安装成功')"
 
+echo ""
+echo "运行离线回归测试..."
+python3 regression_test.py
+
 echo ""
 echo "运行测试..."
 python3 test_youdao.py
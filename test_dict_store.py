@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+单元测试 - 验证紧凑常驻词典存储 CompactDictStore（不联网）
+
+运行：
+    python test_dict_store.py
+    python -m pytest test_dict_store.py
+"""
+
+import sys
+
+from dict_store import (
+    BasicSense,
+    CollinsSense,
+    CompactDictStore,
+    DictEntry,
+    format_entry,
+    parse_translation_text,
+)
+
+
+# fetch_translation() 的典型输出：柯林斯释义（含 [套语] 标签、只有英文的例句、空释义）+ 基本翻译
+HELLO_TEXT = """【柯林斯英汉双解大词典】
+  1. CONVENTION You say "Hello" to someone when you meet them
+    你好 (打招呼用语)
+    [套语]
+    例：Hello, Trish. I won't shake hands, because I'm filthy.
+    你好，特里斯。我就不握手了，我的手好脏。
+
+  2. Hello is also a noun
+    招呼
+    N-COUNT
+    例：The salesperson greeted me with a warm hello.
+    那位推销员向我打了个热情的招呼。
+    例：A moment later, Cohen picked up the phone. "Hello?"
+
+  3.
+
+【基本翻译】
+  int. 喂，你好（用于问候或打招呼）
+  n. 招呼，问候；（Hello）（法、印、美、俄）埃洛（人名）
+    其他释义"""
+
+
+def test_parse_format_round_trip():
+    entry = parse_translation_text("hello", HELLO_TEXT)
+    assert format_entry(entry) == HELLO_TEXT
+
+    first, second, third = entry.collins
+    assert (first.number, first.pos) == (1, "CONVENTION")
+    assert first.notes == ["你好 (打招呼用语)", "[套语]"]
+    assert second.pos == ""
+    assert second.examples[1] == ('A moment later, Cohen picked up the phone. "Hello?"', "")
+    assert (third.number, third.definition) == (3, "")
+    assert entry.basic[0] == BasicSense("int.", "喂，你好（用于问候或打招呼）")
+    assert entry.basic[2] == BasicSense("", "其他释义")
+
+
+def test_parse_rejects_error_text():
+    try:
+        parse_translation_text("xyz", "错误：未找到翻译容器")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("错误信息应当抛出 ValueError")
+
+
+def test_store_round_trip():
+    store = CompactDictStore()
+    store.add_translation("hello", HELLO_TEXT)
+    assert "hello" in store
+    assert "world" not in store
+    assert store.get("world") is None
+    assert store.get_text("hello") == HELLO_TEXT
+    assert store["hello"] == parse_translation_text("hello", HELLO_TEXT)
+
+
+def test_readd_same_word_keeps_count():
+    store = CompactDictStore()
+    store.add_translation("hello", HELLO_TEXT)
+    store.add(DictEntry("hello", [BasicSense("n.", "新的释义")]))
+    assert len(store) == 1
+    assert store["hello"].basic == [BasicSense("n.", "新的释义")]
+    assert list(store) == ["hello"]
+
+
+def test_iteration_after_resize():
+    store = CompactDictStore()
+    # 初始 8 个槽位，1000 个单词会触发多次扩容
+    words = [f"word{i}" for i in range(1000)] + ["café", "naïve"]
+    for word in words:
+        store.add(DictEntry(word, [BasicSense("n.", word.upper())]))
+    assert len(store) == len(words)
+    assert sorted(store) == sorted(words)
+    for word in words:
+        assert store[word].basic[0].text == word.upper()
+
+
+def test_interned_labels_decode():
+    store = CompactDictStore()
+    for word in ("a1", "a2"):
+        sense = CollinsSense(
+            1, "N-COUNT", "definition", ["中文", "[套语]", "[正式]"], [("en", "中")]
+        )
+        store.add(DictEntry(word, [BasicSense("n.", "释义")], [sense]))
+    # 词性和标签各只保存一份
+    assert sorted(store._tags) == sorted(["n.", "N-COUNT", "[套语]", "[正式]"])
+    sense = store["a2"].collins[0]
+    assert sense.notes == ["中文", "[套语]", "[正式]"]
+    assert sense.pos == "N-COUNT"
+    assert sense.examples == [("en", "中")]
+
+
+def test_separators_in_text_are_cleaned():
+    store = CompactDictStore()
+    store.add(DictEntry("odd", [BasicSense("n.", "a\x1eb\x1fc")]))
+    assert store["odd"].basic == [BasicSense("n.", "a b c")]
+
+
+def main():
+    """
+    主函数，依次运行本文件里所有 test_ 开头的函数
+    """
+    tests = [(name, func) for name, func in globals().items() if name.startswith("test_")]
+    failed = 0
+    for name, func in tests:
+        try:
+            func()
+            print(f"✓ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {name}: {e}")
+
+    print(f"\n测试结果: {len(tests) - failed} 通过, {failed} 失败")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+单元测试 - 验证 gloss 模式的分词、去重、批量查询和词汇表输出（不联网）
+
+运行：
+    python test_gloss.py
+    python -m pytest test_gloss.py
+"""
+
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+
+import youdao_dict
+from youdao_dict import (
+    _MAX_TAIL,
+    WORD_PATTERN,
+    collect_glossary,
+    format_glossary,
+    is_error,
+    iter_tokens,
+    load_word_list,
+    lookup_many,
+)
+
+
+# 单词跨块截断、撇号/连字符开头或结尾、弯引号、非 ASCII 字符
+TOKEN_SAMPLES = [
+    "",
+    "hello",
+    "Hello, world!",
+    "don't stop-believing -- it's well-known'",
+    "don’t 'quoted' -dash- a--b a''b café naïve",
+    "line one\nline two\r\nline-\nthree",
+    "  leading and trailing spaces  ",
+]
+
+ERROR_WORD_TEXT = "【基本翻译】\n  n. 错误；误差"
+
+
+def _finditer(text):
+    return [(m.group(), m.start()) for m in WORD_PATTERN.finditer(text)]
+
+
+def test_iter_tokens_matches_finditer():
+    rng = random.Random(0)
+    samples = TOKEN_SAMPLES + [
+        "".join(rng.choices("ab'- ’.\né", k=rng.randint(0, 60)))
+        for _ in range(300)
+    ]
+    for text in samples:
+        expected = _finditer(text)
+        for chunk_size in range(1, 8):
+            actual = list(iter_tokens(io.StringIO(text), chunk_size=chunk_size))
+            assert actual == expected, (text, chunk_size, actual)
+
+
+def test_iter_tokens_caps_the_tail():
+    # 没有空格的超长"单词"被切开处理，而不是一直留在内存里等下一块
+    long_word = "x" * (_MAX_TAIL * 3)
+    chunk_size = 1000
+    tokens = list(iter_tokens(io.StringIO(long_word + " end"), chunk_size=chunk_size))
+
+    assert tokens[-1] == ("end", len(long_word) + 1)
+    pieces = tokens[:-1]
+    assert len(pieces) > 1
+    assert "".join(word for word, _ in pieces) == long_word
+    position = 0
+    for word, offset in pieces:
+        assert offset == position
+        assert len(word) <= _MAX_TAIL + chunk_size
+        position += len(word)
+
+
+def test_collect_glossary_dedupes():
+    tokens = _finditer("Running runs, the run. The RUN ran")
+    entries, total = collect_glossary(tokens)
+    assert total == 7
+    assert list(entries) == ["running", "runs", "the", "run", "ran"]
+    assert entries["the"] == ["the", 2, 14]
+    assert entries["run"] == ["run", 2, 18]
+
+
+def test_collect_glossary_with_lemma_and_skip():
+    tokens = _finditer("Running runs, the run. The RUN ran")
+    entries, total = collect_glossary(tokens, use_lemma=True, skip={"the"})
+    assert total == 7
+    # 按原形合并，保留首次出现的表层形式和偏移量
+    assert entries == {"run": ["Running", 5, 0]}
+
+
+def test_load_word_list():
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("# 熟词表\nThe\n\n  Runs  \n")
+        assert load_word_list(path) == {"the", "runs"}
+        assert load_word_list(path, use_lemma=True) == {"the", "run"}
+    finally:
+        os.remove(path)
+
+
+def test_is_error():
+    assert is_error("错误：HTTP状态码 404")
+    assert not is_error(ERROR_WORD_TEXT)
+    assert not is_error("")
+
+
+def test_lookup_many_separates_errors():
+    results = {
+        "error": ERROR_WORD_TEXT,
+        "xyzzy": "错误：未找到翻译区域（可能单词不存在或页面结构已更改）",
+    }
+    fetch_translation = youdao_dict.fetch_translation
+    youdao_dict.fetch_translation = lambda word, session=None: results[word]
+    try:
+        translations, errors = lookup_many(["error", "xyzzy"], workers=2)
+    finally:
+        youdao_dict.fetch_translation = fetch_translation
+    # 释义里含"错误"的单词不算查询失败
+    assert translations == {"error": ERROR_WORD_TEXT}
+    assert errors == {"xyzzy": results["xyzzy"]}
+
+
+def test_format_glossary_with_errors():
+    entries = {"error": ["Errors", 2, 0], "xyzzy": ["xyzzy", 1, 7]}
+    translations = {"error": ERROR_WORD_TEXT}
+    errors = {"xyzzy": "错误：HTTP状态码 404"}
+
+    items = json.loads(format_glossary(entries, translations, errors, fmt="json"))
+    assert items[0] == {
+        "word": "Errors",
+        "key": "error",
+        "count": 2,
+        "first_offset": 0,
+        "translation": ERROR_WORD_TEXT,
+        "error": None,
+    }
+    assert items[1]["translation"] is None
+    assert items[1]["error"] == "错误：HTTP状态码 404"
+
+    assert format_glossary(entries, translations, errors).split("\n") == [
+        "Errors (error)  [2 次，首次出现于第 0 个字符]",
+        "    【基本翻译】",
+        "      n. 错误；误差",
+        "",
+        "xyzzy  [1 次，首次出现于第 7 个字符]",
+        "    ✗ 错误：HTTP状态码 404",
+        "",
+    ]
+
+
+def test_format_glossary_without_lookup():
+    entries = {"run": ["Running", 3, 0]}
+    assert format_glossary(entries, {}) == "Running (run)  [3 次，首次出现于第 0 个字符]"
+
+
+def main():
+    """
+    主函数，依次运行本文件里所有 test_ 开头的函数
+    """
+    tests = [(name, func) for name, func in globals().items() if name.startswith("test_")]
+    failed = 0
+    for name, func in tests:
+        try:
+            func()
+            print(f"✓ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {name}: {e}")
+
+    print(f"\n测试结果: {len(tests) - failed} 通过, {failed} 失败")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+单元测试 - 验证查询词规范化、词形还原和 URL 构造（不联网）
+
+运行：
+    python test_normalize.py
+    python -m pytest test_normalize.py
+"""
+
+import sys
+
+from youdao_dict import build_search_url, lemmatize, lookup_key, normalize_word
+
+
+# 屈折形式 -> 期望的原形
+LEMMA_CASES = {
+    # 复数、第三人称单数
+    "runs": "run", "ideas": "idea", "photos": "photo", "cases": "case",
+    "shoes": "shoe", "studies": "study", "ties": "tie", "boxes": "box",
+    "watches": "watch", "classes": "class", "buses": "bus", "heroes": "hero",
+    # 形似复数的原形
+    "this": "this", "bus": "bus", "news": "news", "canvas": "canvas",
+    "atlas": "atlas", "lens": "lens", "always": "always", "christmas": "christmas",
+    # -selves、物主代词、-is -> -es 复数
+    "themselves": "themself", "ourselves": "ourself", "yourselves": "yourself",
+    "hers": "hers", "ours": "ours", "yours": "yours", "theirs": "theirs",
+    "crises": "crisis", "analyses": "analysis", "theses": "thesis",
+    "quizzes": "quiz", "buzzes": "buzz",
+    # -ing
+    "running": "run", "making": "make", "hoping": "hope", "writing": "write",
+    "changing": "change", "using": "use", "dying": "die", "playing": "play",
+    "arguing": "argue", "smiling": "smile", "freezing": "freeze",
+    "beginning": "begin", "eating": "eat", "speaking": "speak",
+    "visiting": "visit", "telling": "tell", "staring": "stare",
+    "starring": "star", "boring": "boring", "string": "string", "sing": "sing",
+    # -ed
+    "liked": "like", "stopped": "stop", "played": "play", "noted": "note",
+    "used": "use", "tied": "tie", "created": "create", "included": "include",
+    "united": "unite", "produced": "produce", "related": "relate",
+    "negotiated": "negotiate", "required": "require", "troubled": "trouble",
+    "organized": "organize", "involved": "involve", "caused": "cause",
+    "judged": "judge", "controlled": "control", "agreed": "agree",
+    "added": "add", "treated": "treat", "poured": "pour", "claimed": "claim",
+    "avoided": "avoid", "visited": "visit", "opened": "open",
+    "considered": "consider", "developed": "develop", "focused": "focus",
+    "filled": "fill", "bleed": "bleed", "proceed": "proceed",
+    "embed": "embed", "embedded": "embed", "wedding": "wedding",
+    # 不规则变形
+    "went": "go", "going": "go", "children": "child", "was": "be",
+}
+
+
+def test_normalize_word():
+    assert normalize_word("Running") == "running"
+    assert normalize_word("  running \t") == "running"
+    assert normalize_word("ＲＵＮ") == "run"  # 全角字母
+    assert normalize_word("don’t") == "don't"
+    assert normalize_word("ice   cream") == "ice cream"
+    assert normalize_word("Straße") == "strasse"
+    assert normalize_word("   ") == ""
+
+
+def test_lemmatize():
+    wrong = {
+        word: lemmatize(word)
+        for word, expected in LEMMA_CASES.items()
+        if lemmatize(word) != expected
+    }
+    assert not wrong, wrong
+
+
+def test_lemmatize_leaves_phrases_alone():
+    assert lemmatize("well-known") == "well-known"
+    assert lemmatize("ice cream") == "ice cream"
+    assert lemmatize("café") == "café"
+
+
+def test_lookup_key():
+    assert lookup_key(" Running ") == "running"
+    assert lookup_key(" Running ", use_lemma=True) == "run"
+    assert lookup_key("Runs", use_lemma=True) == lookup_key("running", use_lemma=True)
+
+
+def test_build_search_url():
+    base = "https://dict.youdao.com/search?q="
+    assert build_search_url("hello") == base + "hello"
+    assert build_search_url("rock & roll") == base + "rock%20%26%20roll"
+    assert build_search_url("a#b?c/d") == base + "a%23b%3Fc%2Fd"
+    assert build_search_url("café") == base + "caf%C3%A9"
+
+
+def main():
+    """
+    主函数，依次运行本文件里所有 test_ 开头的函数
+    """
+    tests = [(name, func) for name, func in globals().items() if name.startswith("test_")]
+    failed = 0
+    for name, func in tests:
+        try:
+            func()
+            print(f"✓ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {name}: {e}")
+
+    print(f"\n测试结果: {len(tests) - failed} 通过, {failed} 失败")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,11 +24,352 @@ C/Rust类比：
 - Python: 使用 lxml（C语言实现，性能接近原生）
 """
 
+import argparse
+import json
+import re
 import sys
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
 import requests
 from bs4 import BeautifulSoup
 
 
+# 不规则变形的例外表：屈折形式 -> 原形
+# 也用来"保护"那些看起来像屈折形式、其实本身就是原形的单词（映射到自身）
+LEMMA_EXCEPTIONS = {
+    # be / have / do
+    "am": "be", "is": "be", "are": "be", "was": "be", "were": "be",
+    "been": "be", "being": "be",
+    "has": "have", "had": "have", "having": "have",
+    "does": "do", "did": "do", "done": "do", "doing": "do",
+    # 常见不规则动词
+    "went": "go", "gone": "go", "goes": "go",
+    "ran": "run", "came": "come", "became": "become",
+    "made": "make", "said": "say", "saw": "see", "seen": "see",
+    "took": "take", "taken": "take", "gave": "give", "given": "give",
+    "got": "get", "gotten": "get", "knew": "know", "known": "know",
+    "thought": "think", "told": "tell", "found": "find",
+    "felt": "feel", "kept": "keep", "held": "hold",
+    "brought": "bring", "bought": "buy", "caught": "catch",
+    "taught": "teach", "wrote": "write", "written": "write",
+    "spoke": "speak", "spoken": "speak", "began": "begin", "begun": "begin",
+    "ate": "eat", "eaten": "eat", "drove": "drive", "driven": "drive",
+    "fell": "fall", "fallen": "fall", "flew": "fly", "flown": "fly",
+    "grew": "grow", "grown": "grow", "threw": "throw", "thrown": "throw",
+    "chose": "choose", "chosen": "choose", "broke": "break", "broken": "break",
+    "stood": "stand", "understood": "understand", "sat": "sit",
+    "met": "meet", "paid": "pay", "sent": "send", "built": "build",
+    "lost": "lose", "meant": "mean", "sold": "sell", "won": "win",
+    "led": "lead", "slept": "sleep", "spent": "spend",
+    "lain": "lie", "risen": "rise", "wore": "wear",
+    "worn": "wear", "forgot": "forget", "forgotten": "forget",
+    # 不规则复数
+    "children": "child", "men": "man", "women": "woman",
+    "feet": "foot", "teeth": "tooth", "mice": "mouse", "geese": "goose",
+    "wives": "wife", "knives": "knife", "halves": "half", "wolves": "wolf",
+    "shelves": "shelf", "criteria": "criterion", "phenomena": "phenomenon",
+    # -is -> -es 的复数
+    "crises": "crisis", "analyses": "analysis", "theses": "thesis",
+    "hypotheses": "hypothesis", "diagnoses": "diagnosis", "emphases": "emphasis",
+    "parentheses": "parenthesis", "syntheses": "synthesis", "oases": "oasis",
+    "quizzes": "quiz",
+    # 形似屈折、实为原形的单词
+    "news": "news", "series": "series", "species": "species",
+    "physics": "physics", "mathematics": "mathematics", "always": "always",
+    "perhaps": "perhaps", "nothing": "nothing", "something": "something",
+    "anything": "anything", "everything": "everything", "thing": "thing",
+    "morning": "morning", "evening": "evening", "during": "during",
+    "ceiling": "ceiling", "interesting": "interesting", "king": "king",
+    "bring": "bring", "spring": "spring", "string": "string",
+    "need": "need", "speed": "speed", "seed": "seed", "indeed": "indeed",
+    "hundred": "hundred", "sacred": "sacred", "naked": "naked",
+    "boring": "boring", "pudding": "pudding", "sibling": "sibling",
+    "darling": "darling", "going": "go",
+    "canvas": "canvas", "atlas": "atlas", "lens": "lens", "bias": "bias",
+    "alias": "alias", "gas": "gas", "whereas": "whereas",
+    "overseas": "overseas", "chaos": "chaos", "cosmos": "cosmos",
+    "ethos": "ethos", "kudos": "kudos", "sometimes": "sometimes",
+    "besides": "besides", "economics": "economics", "politics": "politics",
+    "ethics": "ethics", "athletics": "athletics", "electronics": "electronics",
+    "christmas": "christmas", "hers": "hers", "ours": "ours", "yours": "yours",
+    "theirs": "theirs", "embed": "embed", "wicked": "wicked",
+    "beloved": "beloved", "wedding": "wedding",
+    # 规则会算错的复数
+    "buses": "bus", "gases": "gas", "lenses": "lens", "canvases": "canvas",
+    "atlases": "atlas", "heroes": "hero", "potatoes": "potato",
+    "tomatoes": "tomato", "echoes": "echo", "vetoes": "veto",
+    "movies": "movie", "cookies": "cookie", "zombies": "zombie",
+    # -eed 结尾的词大多本身就是原形（bleed, proceed），只有这些是 -ee + d
+    "agreed": "agree", "disagreed": "disagree", "freed": "free",
+    "decreed": "decree", "guaranteed": "guarantee", "refereed": "referee",
+}
+
+# 去掉 -ing/-ed 之后规则无法判断的词干 -> 原形
+LEMMA_STEM_FIXES = {
+    # 省略了 e，但词干本身的拼写看不出来（writ(e) 与 visit 无法区分）
+    "writ": "write", "unit": "unite", "invit": "invite", "excit": "excite",
+    "recit": "recite", "ignit": "ignite", "creat": "create",
+    "chang": "change", "arrang": "arrange", "exchang": "exchange",
+    "challeng": "challenge", "rang": "range",
+    "ignor": "ignore", "explor": "explore", "stor": "store", "scor": "score",
+    "restor": "restore", "ador": "adore", "complet": "complete",
+    "compet": "compete", "delet": "delete", "promot": "promote",
+    "quot": "quote", "devot": "devote", "tast": "taste", "wast": "waste",
+    "hast": "haste", "breath": "breathe", "phon": "phone", "zon": "zone",
+    "clon": "clone", "accus": "accuse", "us": "use",
+    # 英式拼写双写了 l（controlled, travelling），而 fill/tell 的 ll 是原形的一部分
+    "controll": "control", "travell": "travel", "cancell": "cancel",
+    "labell": "label", "modell": "model", "patroll": "patrol",
+    "compell": "compel", "propell": "propel", "expell": "expel",
+    "repell": "repel", "excell": "excel", "signall": "signal",
+}
+
+# 词尾双写后需要还原的辅音（running -> run, stopped -> stop）
+_DOUBLED_CONSONANTS = set("bdgkmnprtv")
+_VOWELS = set("aeiou")
+
+# 词干以这些结尾时，原形几乎总是以 e 结尾（produc(e), involv(e), argu(e), organiz(e)）
+_E_ENDINGS = (
+    "c", "v", "u", "yp", "iz", "ys", "dg", "rg", "ag", "com",
+    "eas", "aus", "fus", "mus", "ens", "ps", "rs", "is", "iat", "uat", "quir",
+)
+# 词干以这些结尾、并且前面是辅音时，原形以 e 结尾（creat(e) 之外的 relat(e)、comput(e)、
+# includ(e)）；前面是元音时多半本身就是原形（eat, shout, pour, speak, claim, avoid）
+_E_AFTER_CONSONANT = (
+    "at", "ut", "ur", "ir", "ar", "id", "ad", "od", "ud", "ib",
+    "ak", "ok", "ik", "am", "im", "um", "in", "ap", "il", "ul",
+)
+
+# 英文单词：字母开头和结尾，中间允许撇号和连字符（don't, well-known）
+WORD_PATTERN = re.compile(r"[A-Za-z]+(?:['\u2019-][A-Za-z]+)*")
+# 块末尾可能被截断的单词，留到下一个块再处理
+_TRAILING_WORD = re.compile(r"[A-Za-z'\u2019-]+\Z")
+_MAX_TAIL = 4096
+# gloss 模式每次读取的字符数
+GLOSS_CHUNK_SIZE = 1 << 20
+# 所有错误信息的开头
+ERROR_PREFIX = "错误："
+
+# 请求查询结果页面时使用的请求头
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+
+def normalize_word(word: str) -> str:
+    """
+    规范化查询词：Unicode 兼容分解（NFKC）、大小写折叠、空白折叠。
+
+    "Running"、"running"、" running " 都会得到同一个 "running"，
+    保证同一个单词只查询一次。
+
+    参数:
+        word (str): 用户输入的原始单词
+
+    返回:
+        str: 规范化后的单词（可能为空字符串）
+
+    C/Rust类比：
+    - C: 需要 ICU 库的 unorm2_normalize + u_strFoldCase
+    - Rust: word.nfkc().collect::<String>().to_lowercase()
+    - Python: unicodedata.normalize("NFKC", word).casefold()
+    """
+    word = unicodedata.normalize("NFKC", word).casefold()
+    # 统一弯引号，否则 don’t 和 don't 会被当成两个单词
+    word = word.replace("\u2019", "'").replace("\u2018", "'")
+    return " ".join(word.split())
+
+
+def _needs_e(stem: str) -> bool:
+    """判断去掉 -ing/-ed 后的词干是否省略了词尾的 e。"""
+    if stem.endswith(_E_ENDINGS):
+        return True
+    if len(stem) >= 3 and stem[-3] not in _VOWELS and stem.endswith(_E_AFTER_CONSONANT):
+        return True
+    # 辅音 + l：troubl(e), settl(e), coupl(e)；hurl/curl 的 rl 不算
+    if len(stem) >= 2 and stem[-1] == "l" and stem[-2] in "bcdfgkptz":
+        return True
+    # 元音 + z：freez(e), amaz(e)
+    if len(stem) >= 2 and stem[-1] == "z" and stem[-2] in _VOWELS:
+        return True
+    # 辅音-元音-辅音结尾的短词干：hop(e), not(e), bor(e)
+    return (
+        len(stem) == 3
+        and stem[0] not in _VOWELS
+        and stem[1] in _VOWELS
+        and stem[2] not in _VOWELS
+        and stem[2] not in "wxy"
+    )
+
+
+def _undo_suffix(stem: str) -> str:
+    """
+    去掉 -ing/-ed 之后修复词干：查词干表、还原双写辅音或补回被删除的 e。
+
+    running -> runn -> run，making -> mak -> make，creating -> creat -> create
+    """
+    if stem in LEMMA_STEM_FIXES:
+        return LEMMA_STEM_FIXES[stem]
+    # add/odd/egg 的双写是原形的一部分，所以只处理 4 个字母以上的词干
+    if (
+        len(stem) >= 4
+        and stem[-1] == stem[-2]
+        and stem[-1] in _DOUBLED_CONSONANTS
+    ):
+        return stem[:-1]
+    if _needs_e(stem):
+        return stem + "e"
+    return stem
+
+
+def lemmatize(word: str) -> str:
+    """
+    基于规则的英文词形还原：先查例外表，再按词尾规则去掉屈折变化。
+
+    这只是一个轻量的本地启发式实现（不依赖 nltk/spaCy），
+    覆盖复数、第三人称单数、-ing、-ed 等常见形式；
+    规则处理不了的不规则形式放进 LEMMA_EXCEPTIONS，
+    去掉词尾后拼写有歧义的词干放进 LEMMA_STEM_FIXES。
+
+    参数:
+        word (str): 已经过 normalize_word 处理的单词
+
+    返回:
+        str: 原形；无法判断时原样返回
+
+    示例:
+        lemmatize("runs") -> "run"
+        lemmatize("running") -> "run"
+        lemmatize("studies") -> "study"
+        lemmatize("included") -> "include"
+        lemmatize("went") -> "go"
+    """
+    if word in LEMMA_EXCEPTIONS:
+        return LEMMA_EXCEPTIONS[word]
+    # 只处理纯字母单词，短语和带连字符的词原样返回
+    if not word.isalpha() or not word.isascii() or len(word) <= 3:
+        return word
+
+    if word.endswith("ies"):
+        # ties/dies/lies -> tie；studies -> study
+        return word[:-1] if len(word) == 4 else word[:-3] + "y"
+    if word.endswith("selves"):
+        # themselves/ourselves -> themself/ourself，与 myself/yourself 一致
+        return word[:-6] + "self"
+    if word.endswith(("sses", "shes", "ches", "xes", "zzes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+
+    if word.endswith("ing") and len(word) >= 5:
+        stem = word[:-3]
+        # tying/dying/lying -> tie/die/lie
+        if len(word) == 5 and stem.endswith("y"):
+            return stem[:-1] + "ie"
+        # 词干里至少要有一个元音，否则 "sing"/"bring" 这类词会被误伤
+        if any(c in _VOWELS or c == "y" for c in stem):
+            return _undo_suffix(stem)
+        return word
+
+    if word.endswith("ied"):
+        # tied/died/lied -> tie；studied -> study
+        return word[:-1] if len(word) == 4 else word[:-3] + "y"
+    if word.endswith("eed"):
+        # bleed/proceed 本身就是原形；agreed/freed 在例外表里
+        return word
+    if word.endswith("ed"):
+        stem = word[:-2]
+        if any(c in _VOWELS or c == "y" for c in stem):
+            return _undo_suffix(stem)
+        return word
+
+    return word
+
+
+def lookup_key(word: str, use_lemma: bool = False) -> str:
+    """
+    计算查询键：所有查询（包括批量查询的去重）都以这个键为准。
+
+    参数:
+        word (str): 用户输入的原始单词（表层形式）
+        use_lemma (bool): 是否把屈折形式还原成原形
+
+    返回:
+        str: 规范化（以及可选的词形还原）后的查询键
+    """
+    key = normalize_word(word)
+    if use_lemma:
+        key = lemmatize(key)
+    return key
+
+
+def build_search_url(word: str) -> str:
+    """
+    构造有道词典的查询 URL，对单词做 URL 转义。
+
+    直接拼接 f"...?q={word}" 时，带空格、&、# 或非 ASCII 字符的查询会被截断或出错。
+    """
+    return f"https://dict.youdao.com/search?q={quote(word, safe='')}"
+
+
+def is_error(text: str) -> bool:
+    """
+    判断 fetch_* / parse_* 的返回值是否是错误信息。
+
+    所有错误信息都以 "错误：" 开头；不能只看文本里有没有"错误"两个字，
+    error、mistake、wrong 这些单词的释义里本来就有"错误"。
+    """
+    return text.startswith(ERROR_PREFIX)
+
+
+def parse_basic_translation(html: str) -> str:
+    """
+    从有道词典页面的 HTML 中提取基本翻译（不联网，方便用录制的页面做回归测试）。
+
+    参数:
+        html (str): 查询结果页面的 HTML
+
+    返回:
+        str: 翻译文本，如果提取失败则返回错误信息
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    # 查找基本翻译容器
+    results_contents = soup.find("div", id="results-contents")
+    if not results_contents:
+        return "错误：未找到翻译区域（可能单词不存在或页面结构已更改）"
+
+    trans_container = results_contents.find("div", class_="trans-container")
+    if not trans_container:
+        return "错误：未找到翻译容器"
+
+    translation_items = trans_container.find_all("li")
+    if not translation_items:
+        return "错误：未找到翻译内容"
+
+    # 提取翻译文本
+    translations = []
+    for item in translation_items:
+        text = item.get_text(strip=True)
+        if text:
+            translations.append(text)
+
+    if not translations:
+        return "错误：提取到的翻译内容为空"
+
+    return "\n".join(translations)
+
+
 def fetch_basic_translation(word: str) -> str:
     """
     从有道词典获取单词的基本翻译。
@@ -48,50 +389,16 @@ def fetch_basic_translation(word: str) -> str:
     - Rust: fn fetch_basic_translation(word: &str) -> String
     - Python: def fetch_basic_translation(word: str) -> str:
     """
-    url = f"https://dict.youdao.com/search?q={word}"
+    url = build_search_url(word)
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-    }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = requests.get(url, headers=REQUEST_HEADERS, timeout=10)
 
         if response.status_code != 200:
             return f"错误：HTTP状态码 {response.status_code}"
 
-        soup = BeautifulSoup(response.text, "lxml")
-
-        # 查找基本翻译容器
-        results_contents = soup.find("div", id="results-contents")
-        if not results_contents:
-            return "错误：未找到翻译区域（可能单词不存在或页面结构已更改）"
-
-        trans_container = results_contents.find("div", class_="trans-container")
-        if not trans_container:
-            return "错误：未找到翻译容器"
-
-        translation_items = trans_container.find_all("li")
-        if not translation_items:
-            return "错误：未找到翻译内容"
-
-        # 提取翻译文本
-        translations = []
-        for item in translation_items:
-            text = item.get_text(strip=True)
-            if text:
-                translations.append(text)
-
-        if not translations:
-            return "错误：提取到的翻译内容为空"
-
-        return "\n".join(translations)
+        return parse_basic_translation(response.text)
 
     except requests.exceptions.Timeout:
         return "错误：网络请求超时（请检查网络连接）"
@@ -101,34 +408,18 @@ def fetch_basic_translation(word: str) -> str:
         return f"错误：未知异常 - {str(e)}"
 
 
-def fetch_collins_translation(word: str) -> str:
+def parse_collins_translation(html: str) -> str:
     """
-    从有道词典获取单词的柯林斯英汉双解大词典翻译（包含英英释义和例句）。
+    从有道词典页面的 HTML 中提取柯林斯英汉双解大词典翻译（包含英英释义和例句）。
 
     参数:
-        word (str): 要查询的英文单词
+        html (str): 查询结果页面的 HTML
 
     返回:
-        str: 柯林斯翻译文本（包含英英释义和例句），如果没有则返回空字符串
-
-    C/Rust类比：
-    - C: char* fetch_collins_translation(const char* word);
-    - Rust: fn fetch_collins_translation(word: &str) -> String
-    - Python: def fetch_collins_translation(word: str) -> str:
+        str: 柯林斯翻译文本，如果没有则返回空字符串
     """
-    url = f"https://dict.youdao.com/search?q={word}"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-
-        if response.status_code != 200:
-            return ""
-
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(html, "lxml")
 
         # 查找柯林斯词典容器
         collins_result = soup.find("div", id="collinsResult")
@@ -284,12 +575,49 @@ def fetch_collins_translation(word: str) -> str:
         return ""
 
 
-def fetch_translation(word: str) -> str:
+def fetch_collins_translation(word: str) -> str:
+    """
+    从有道词典获取单词的柯林斯英汉双解大词典翻译（包含英英释义和例句）。
+
+    参数:
+        word (str): 要查询的英文单词
+
+    返回:
+        str: 柯林斯翻译文本（包含英英释义和例句），如果没有则返回空字符串
+
+    C/Rust类比：
+    - C: char* fetch_collins_translation(const char* word);
+    - Rust: fn fetch_collins_translation(word: &str) -> String
+    - Python: def fetch_collins_translation(word: str) -> str:
+    """
+    url = build_search_url(word)
+    headers = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    }
+
+    try:
+        response = requests.get(url, headers=headers, timeout=10)
+
+        if response.status_code != 200:
+            return ""
+
+        return parse_collins_translation(response.text)
+
+    except Exception:
+        # 柯林斯词典是可选的，出错时不返回错误信息
+        return ""
+
+
+def fetch_translation(word: str, session=None) -> str:
     """
     从有道词典获取单词的翻译（包含基本翻译和柯林斯翻译）。
 
+    基本翻译和柯林斯翻译在同一个页面上，所以只请求一次，再分别解析。
+
     参数:
         word (str): 要查询的英文单词
+        session (requests.Session): 可选，复用连接的会话（批量查询时每个线程一个）
 
     返回:
         str: 翻译文本，包含基本翻译和柯林斯翻译（如果有）
@@ -299,16 +627,45 @@ def fetch_translation(word: str) -> str:
     - Rust: fn fetch_translation(word: &str) -> String
     - Python: def fetch_translation(word: str) -> str:
     """
-    # 获取基本翻译
-    basic_translation = fetch_basic_translation(word)
+    url = build_search_url(word)
+
+    try:
+        response = (session or requests).get(url, headers=REQUEST_HEADERS, timeout=10)
+
+        if response.status_code != 200:
+            return f"错误：HTTP状态码 {response.status_code}"
+
+        html = response.text
+        basic_translation = parse_basic_translation(html)
+
+    except requests.exceptions.Timeout:
+        return "错误：网络请求超时（请检查网络连接）"
+    except requests.exceptions.RequestException as e:
+        return f"错误：网络请求异常 - {str(e)}"
+    except Exception as e:
+        return f"错误：未知异常 - {str(e)}"
 
     # 如果基本翻译出错，直接返回错误
-    if "错误" in basic_translation:
+    if is_error(basic_translation):
         return basic_translation
 
-    # 获取柯林斯翻译（可选）
-    collins_translation = fetch_collins_translation(word)
+    # 柯林斯翻译（可选），解析同一个页面
+    collins_translation = parse_collins_translation(html)
+
+    return format_translation(basic_translation, collins_translation)
+
 
+def format_translation(basic_translation: str, collins_translation: str) -> str:
+    """
+    把基本翻译和柯林斯翻译排版成最终输出的文本。
+
+    参数:
+        basic_translation (str): parse_basic_translation 的结果
+        collins_translation (str): parse_collins_translation 的结果（可能为空）
+
+    返回:
+        str: 柯林斯翻译在前、基本翻译在后的文本
+    """
     # 构建结果
     result = []
 
@@ -368,6 +725,42 @@ def fetch_translation(word: str) -> str:
     return "\n".join(result)
 
 
+def parse_translation_css(html: str) -> str:
+    """
+    使用 CSS 选择器从页面 HTML 中提取基本翻译，结果应与 parse_basic_translation 一致。
+
+    参数:
+        html (str): 查询结果页面的 HTML
+
+    返回:
+        str: 翻译文本，如果提取失败则返回错误信息
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    # 使用 CSS 选择器（lxml 支持）
+    # 这比 find/find_all 更简洁
+    # 类比C: document.querySelectorAll("div#results-contents div.trans-container li")
+    # 类比Rust: scraper::Selector::parse("div#results-contents div.trans-container li")
+    translation_items = soup.select("div#results-contents div.trans-container li")
+
+    if not translation_items:
+        return "错误：未找到翻译内容"
+
+    # 使用列表推导式提取文本
+    # 类比C: 需要循环遍历
+    # 类比Rust: translation_items.iter().map(|item| item.text().trim()).collect()
+    translations = [
+        item.get_text(strip=True)
+        for item in translation_items
+        if item.get_text(strip=True)
+    ]
+
+    if not translations:
+        return "错误：提取到的翻译内容为空"
+
+    return "\n".join(translations)
+
+
 def fetch_translation_xpath(word: str) -> str:
     """
     使用 XPath 方式获取翻译（lxml 特有功能）。
@@ -382,7 +775,7 @@ def fetch_translation_xpath(word: str) -> str:
     - Rust: scraper::Selector::parse("div#results-contents li")
     - Python: soup.select("div#results-contents li")
     """
-    url = f"https://dict.youdao.com/search?q={word}"
+    url = build_search_url(word)
     headers = {
         "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -394,30 +787,7 @@ def fetch_translation_xpath(word: str) -> str:
         if response.status_code != 200:
             return f"错误：HTTP状态码 {response.status_code}"
 
-        soup = BeautifulSoup(response.text, "lxml")
-
-        # 使用 CSS 选择器（lxml 支持）
-        # 这比 find/find_all 更简洁
-        # 类比C: document.querySelectorAll("div#results-contents div.trans-container li")
-        # 类比Rust: scraper::Selector::parse("div#results-contents div.trans-container li")
-        translation_items = soup.select("div#results-contents div.trans-container li")
-
-        if not translation_items:
-            return "错误：未找到翻译内容"
-
-        # 使用列表推导式提取文本
-        # 类比C: 需要循环遍历
-        # 类比Rust: translation_items.iter().map(|item| item.text().trim()).collect()
-        translations = [
-            item.get_text(strip=True)
-            for item in translation_items
-            if item.get_text(strip=True)
-        ]
-
-        if not translations:
-            return "错误：提取到的翻译内容为空"
-
-        return "\n".join(translations)
+        return parse_translation_css(response.text)
 
     except requests.exceptions.Timeout:
         return "错误：网络请求超时"
@@ -427,32 +797,297 @@ def fetch_translation_xpath(word: str) -> str:
         return f"错误：未知异常 - {str(e)}"
 
 
-def main():
+def iter_tokens(stream, chunk_size: int = GLOSS_CHUNK_SIZE):
     """
-    主函数，处理命令行参数并调用翻译函数。
+    按块流式读取文本，逐个产出英文单词及其首字符的偏移量。
+
+    每次只在内存里保留一个块（外加上一个块末尾被截断的半个单词），
+    所以 100MB 的文件也不会整体读入内存。
+
+    参数:
+        stream: 文本流（打开的文件或 sys.stdin）
+        chunk_size (int): 每次读取的字符数
+
+    产出:
+        tuple[str, int]: (单词, 在整个输入中的字符偏移量)
+
+    C/Rust类比：
+    - C: while (fread(buf, 1, n, fp) > 0) { ... }
+    - Rust: BufReader::with_capacity(n, file) + 迭代器
+    - Python: 生成器函数（yield），调用方按需拉取
     """
-    if len(sys.argv) != 2:
-        print("用法: python youdao_dict.py <英文单词>")
-        print("示例: python youdao_dict.py hello")
-        print("\n可选方法:")
-        print("  1. 使用 find/find_all: python youdao_dict.py hello")
-        print("  2. 使用 XPath/CSS: 修改代码调用 fetch_translation_xpath()")
-        sys.exit(1)
+    offset = 0  # buf[0] 在整个输入中的偏移量
+    tail = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buf = tail + chunk
+        # 把末尾可能被截断的单词留到下一轮；
+        # 超长的"单词"（例如没有空格的乱码）直接处理掉，保证内存有上限
+        match = _TRAILING_WORD.search(buf)
+        cut = match.start() if match else len(buf)
+        if len(buf) - cut > _MAX_TAIL:
+            cut = len(buf)
+        for m in WORD_PATTERN.finditer(buf, 0, cut):
+            yield m.group(), offset + m.start()
+        offset += cut
+        tail = buf[cut:]
+
+    for m in WORD_PATTERN.finditer(tail):
+        yield m.group(), offset + m.start()
+
+
+def load_word_list(path: str, use_lemma: bool = False) -> set:
+    """
+    读取停用词表或熟词表（每行一个单词，# 开头为注释），返回查询键集合。
+    """
+    words = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                words.add(lookup_key(line, use_lemma=use_lemma))
+    return words
 
-    word = sys.argv[1]
 
-    print(f"正在查询单词 '{word}' 的翻译...")
+def collect_glossary(tokens, use_lemma: bool = False, skip=frozenset()) -> tuple:
+    """
+    对单词流去重计数。
+
+    参数:
+        tokens: iter_tokens 产出的 (单词, 偏移量) 序列
+        use_lemma (bool): 是否按原形去重
+        skip (set): 要丢弃的查询键（停用词、熟词）
+
+    返回:
+        tuple[dict, int]: ({查询键: [首次出现的表层形式, 次数, 首次出现的偏移量]}, 单词总数)
+        字典按首次出现的顺序排列。
+    """
+    entries = {}
+    keys = {}  # 表层形式 -> 查询键，避免对重复的单词反复规范化
+    total = 0
+    for token, pos in tokens:
+        total += 1
+        key = keys.get(token)
+        if key is None:
+            key = keys[token] = lookup_key(token, use_lemma=use_lemma)
+        if key in skip:
+            continue
+        entry = entries.get(key)
+        if entry is None:
+            entries[key] = [token, 1, pos]
+        else:
+            entry[1] += 1
+    return entries, total
+
+
+def lookup_many(keys, workers: int = 8) -> tuple:
+    """
+    并发查询一批（已去重的）查询键。
+
+    网络请求是 I/O 密集型，线程池足以让多个请求同时进行。
+    每个线程使用自己的 requests.Session（Session 不保证线程安全），
+    同一线程的请求复用 keep-alive 连接，不用每个单词重新建立 TLS 连接。
+
+    返回:
+        tuple[dict, dict]: ({查询键: 翻译文本}, {查询键: 错误信息})，
+        查询失败（fetch_translation 返回错误信息）的单词只出现在第二个字典里。
+    """
+    keys = list(keys)
+    translations = {}
+    errors = {}
+    local = threading.local()
+    sessions = []
+
+    def lookup(key):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+            sessions.append(session)
+        return fetch_translation(key, session=session)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for key, text in zip(keys, executor.map(lookup, keys)):
+                if is_error(text):
+                    errors[key] = text
+                else:
+                    translations[key] = text
+    finally:
+        for session in sessions:
+            session.close()
+    return translations, errors
+
+
+def format_glossary(
+    entries: dict, translations: dict, errors=None, fmt: str = "text"
+) -> str:
+    """
+    把统计结果和翻译格式化为词汇表（text 或 json）。
+
+    查询失败的单词不会把错误信息当成翻译输出：
+    json 里 translation 为 null、error 为错误信息；text 里单独标出。
+    """
+    errors = errors or {}
+    if fmt == "json":
+        items = [
+            {
+                "word": surface,
+                "key": key,
+                "count": count,
+                "first_offset": first,
+                "translation": translations.get(key),
+                "error": errors.get(key),
+            }
+            for key, (surface, count, first) in entries.items()
+        ]
+        return json.dumps(items, ensure_ascii=False, indent=2)
+
+    lines = []
+    for key, (surface, count, first) in entries.items():
+        head = surface if surface == key else f"{surface} ({key})"
+        lines.append(f"{head}  [{count} 次，首次出现于第 {first} 个字符]")
+        translation = translations.get(key)
+        if translation:
+            lines.extend(f"    {line}" for line in translation.split("\n"))
+            lines.append("")
+        elif key in errors:
+            lines.append(f"    ✗ {errors[key]}")
+            lines.append("")
+    return "\n".join(lines)
+
+
+def _gloss_fail(message: str) -> None:
+    """输出错误信息并以退出码 1 结束（gloss 模式的标准输出留给词汇表）。"""
+    print(f"错误：{message}", file=sys.stderr)
+    sys.exit(1)
+
+
+def gloss_main(argv):
+    """
+    gloss 模式：把整篇文章（文件或标准输入）转成去重的词汇表。
+    """
+    parser = argparse.ArgumentParser(
+        prog="youdao_dict.py gloss",
+        description="流式读取文本，去重后批量查询，输出带词频和首次出现位置的词汇表",
+    )
+    parser.add_argument("file", help="输入文本文件，- 表示标准输入")
+    parser.add_argument("--lemma", action="store_true", help="按原形去重和查询")
+    parser.add_argument("--stopwords", help="停用词表文件（每行一个单词）")
+    parser.add_argument("--known", help="熟词表文件（每行一个单词），这些单词不再查询")
+    parser.add_argument(
+        "--format", choices=("text", "json"), default="text", help="输出格式"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="并发查询的线程数")
+    parser.add_argument(
+        "--no-lookup", action="store_true", help="只统计词频，不联网查询"
+    )
+    parser.add_argument("-o", "--output", help="输出文件（默认标准输出）")
+    args = parser.parse_args(argv)
+
+    skip = set()
+    for path in (args.stopwords, args.known):
+        if path:
+            try:
+                skip |= load_word_list(path, use_lemma=args.lemma)
+            except (OSError, UnicodeDecodeError) as e:
+                _gloss_fail(f"无法读取单词表 {path} - {e}")
+
+    start = time.perf_counter()
+    if args.file == "-":
+        entries, total = collect_glossary(
+            iter_tokens(sys.stdin), use_lemma=args.lemma, skip=skip
+        )
+    else:
+        try:
+            with open(args.file, encoding="utf-8", errors="replace") as f:
+                entries, total = collect_glossary(
+                    iter_tokens(f), use_lemma=args.lemma, skip=skip
+                )
+        except OSError as e:
+            _gloss_fail(f"无法读取输入文件 {args.file} - {e}")
+    scan_time = time.perf_counter() - start
+
+    # 统计信息输出到 stderr，避免混入词汇表
+    print(
+        f"扫描 {total:,} 个单词，去重后 {len(entries):,} 个，"
+        f"耗时 {scan_time:.2f} 秒（{total / max(scan_time, 1e-9):,.0f} 词/秒）",
+        file=sys.stderr,
+    )
+
+    translations = {}
+    errors = {}
+    if not args.no_lookup and entries:
+        start = time.perf_counter()
+        translations, errors = lookup_many(entries, workers=args.workers)
+        lookup_time = time.perf_counter() - start
+        # 吞吐量只算查询成功的单词
+        print(
+            f"查询 {len(entries):,} 个单词：成功 {len(translations):,} 个，"
+            f"失败 {len(errors):,} 个，耗时 {lookup_time:.2f} 秒"
+            f"（{len(translations) / max(lookup_time, 1e-9):,.1f} 词/秒）",
+            file=sys.stderr,
+        )
+
+    output = format_glossary(entries, translations, errors, fmt=args.format)
+    if args.output:
+        try:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+        except OSError as e:
+            _gloss_fail(f"无法写入输出文件 {args.output} - {e}")
+    else:
+        print(output)
+
+
+def main():
+    """
+    主函数，处理命令行参数并调用翻译函数。
+    """
+    # gloss 子命令：批量处理整篇文本
+    if sys.argv[1:2] == ["gloss"]:
+        gloss_main(sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(
+        description="有道词典爬虫：查询英文单词的基本翻译和柯林斯双解释义",
+        epilog="示例: python youdao_dict.py hello\n"
+        "      python youdao_dict.py --lemma running\n"
+        "      python youdao_dict.py gloss article.txt --format json\n\n"
+        "可选方法:\n"
+        "  1. 使用 find/find_all: python youdao_dict.py hello\n"
+        "  2. 使用 XPath/CSS: 修改代码调用 fetch_translation_xpath()",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("word", help="要查询的英文单词")
+    parser.add_argument(
+        "--lemma",
+        action="store_true",
+        help="先把屈折形式还原成原形再查询（running -> run）",
+    )
+    args = parser.parse_args()
+
+    word = args.word
+    key = lookup_key(word, use_lemma=args.lemma)
+    if not key:
+        parser.error("查询的单词不能为空")
+
+    if key != word:
+        print(f"正在查询单词 '{word}'（查询键 '{key}'）的翻译...")
+    else:
+        print(f"正在查询单词 '{word}' 的翻译...")
     print("-" * 50)
 
     # 使用标准方法（find/find_all），包含基本翻译和柯林斯翻译（如果有）
-    translation = fetch_translation(word)
+    translation = fetch_translation(key)
 
     # 如果想使用 XPath 方法，取消下面的注释：
-    # translation = fetch_translation_xpath(word)
+    # translation = fetch_translation_xpath(key)
 
     print(translation)
 
-    if "错误" in translation:
+    if is_error(translation):
         sys.exit(1)
 
 